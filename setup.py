@@ -62,7 +62,8 @@ setup_args = dict(
         "watchdog>=3",
         "typer>=0.9",
         "rich>=13",
-        "iterative-telemetry>=0.0.5"
+        "iterative-telemetry>=0.0.5",
+        "appdirs>=1.4.4",
     ],
     extras_require={
         "dev": [
@@ -9,6 +9,8 @@ from typing import Union
 
 import numpy as np
 import pandas as pd
+from pydantic import Field
+from pydantic import validator
 
 from evidently.base_metric import ColumnMetricResult
 from evidently.base_metric import MetricResult
@@ -60,6 +62,14 @@ class ColumnDataDriftMetrics(ColumnMetricResult):
     stattest_threshold: Optional[float]
     drift_score: Numeric
     drift_detected: bool
+    # materialized once at metric creation so tests and renderers do not re-round per access
+    rounded_score: Numeric = Field(None, exclude=True)
+
+    @validator("rounded_score", always=True)
+    def _round_drift_score(cls, value, values):
+        if value is not None:
+            return value
+        return round(float(values["drift_score"]), 3)
 
     current: DriftStatsField
     reference: DriftStatsField
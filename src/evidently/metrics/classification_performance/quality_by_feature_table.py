@@ -58,8 +58,9 @@ class ClassificationQualityByFeatureTable(Metric[ClassificationQualityByFeatureT
             text_cols = [col.column_name for col in data_definition.get_columns("text_features")]
             text_features_gen = {}
             text_features_gen_result = []
+            columns_filter = set(self.columns) if self.columns is not None else None
             for col in text_cols:
-                if self.columns is not None and col not in self.columns:
+                if columns_filter is not None and col not in columns_filter:
                     continue
                 if self.descriptors is None or col not in self.descriptors:
                     col_dict = {
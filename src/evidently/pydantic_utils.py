@@ -68,6 +68,13 @@ class FrozenBaseModel(BaseModel, metaclass=FrozenBaseMeta):
             object_setattr(self, "_init_values", {})
         return self._init_values
 
+    @classmethod
+    def construct(cls, _fields_set=None, **values):
+        res = super().construct(_fields_set, **values)
+        # construct() bypasses __init__, so close the init phase explicitly
+        object_setattr(res, "_init_values", None)
+        return res
+
     def __setattr__(self, key, value):
         if self.__init_values__ is not None:
             if key not in self.__fields__ and key not in self.__private_attributes__:
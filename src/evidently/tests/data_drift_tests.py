@@ -1,4 +1,7 @@
 from abc import ABC
+from functools import partial
+from itertools import repeat
+from typing import Callable
 from typing import ClassVar
 from typing import Dict
 from typing import List
@@ -9,13 +12,17 @@ import numpy as np
 import pandas as pd
 
 from evidently.base_metric import ColumnName
+from evidently.base_metric import InputData
 from evidently.calculations.data_drift import ColumnDataDriftMetrics
+from evidently.calculations.data_drift import get_dataset_drift
+from evidently.calculations.data_drift import get_one_column_drift
 from evidently.calculations.stattests import PossibleStatTestType
 from evidently.metric_results import DatasetColumns
 from evidently.metric_results import HistogramData
 from evidently.metrics import ColumnDriftMetric
 from evidently.metrics import DataDriftTable
 from evidently.metrics import EmbeddingsDriftMetric
+from evidently.metrics.data_drift.data_drift_table import DataDriftTableRenderer
 from evidently.metrics.data_drift.data_drift_table import DataDriftTableResults
 from evidently.metrics.data_drift.embedding_drift_methods import DriftMethod
 from evidently.model.widget import BaseWidgetInfo
@@ -23,7 +30,6 @@ from evidently.renderers.base_renderer import DetailsInfo
 from evidently.renderers.base_renderer import TestHtmlInfo
 from evidently.renderers.base_renderer import TestRenderer
 from evidently.renderers.base_renderer import default_renderer
-from evidently.renderers.html_widgets import plotly_figure
 from evidently.renderers.html_widgets import table_data
 from evidently.tests.base_test import BaseCheckValueTest
 from evidently.tests.base_test import ConditionTestParameters
@@ -36,16 +42,30 @@ from evidently.tests.base_test import TestResult
 from evidently.tests.base_test import TestStatus
 from evidently.tests.base_test import TestValueCondition
 from evidently.utils.data_drift_utils import resolve_stattest_threshold
+from evidently.utils.data_operations import process_columns
 from evidently.utils.generators import BaseGenerator
 from evidently.utils.types import Numeric
-from evidently.utils.visualizations import plot_contour_single
-from evidently.utils.visualizations import plot_distr_with_cond_perc_button
 
 DATA_DRIFT_GROUP = GroupData("data_drift", "Data Drift", "")
 GroupingTypes.TestGroup.add_value(DATA_DRIFT_GROUP)
 
+# status by drift_detected flag
+_STATUS_BY_DETECTED = (TestStatus.SUCCESS, TestStatus.FAIL)
+
+_COLUMN_DRIFT_DESCRIPTION = (
+    "The drift score for the feature **{name}** is {score:.3g}. "
+    "The drift detection method is {stattest}. "
+    "The drift detection threshold is {threshold}."
+)
+
 
 class ColumnDriftParameter(ExcludeNoneMixin, TestParameters):  # type: ignore[misc] # pydantic Config
+    class Config:
+        copy_on_model_validation = "none"
+
+    # flip to route construction through full pydantic validation
+    validate_on_build: ClassVar[bool] = False
+
     stattest: str
     score: float
     threshold: float
@@ -54,46 +74,67 @@ class ColumnDriftParameter(ExcludeNoneMixin, TestParameters):  # type: ignore[mi
 
     @classmethod
     def from_metric(cls, data: ColumnDataDriftMetrics, column_name: str = None):
-        return ColumnDriftParameter(
+        # construct() skips field validation: the values come straight from a
+        # calculated metric result and this runs once per feature
+        build = cls if cls.validate_on_build else cls.construct
+        return build(
             stattest=data.stattest_name,
-            score=np.round(data.drift_score, 3),
+            score=data.rounded_score,
             threshold=data.stattest_threshold,
-            detected=data.drift_detected,
+            detected=bool(data.drift_detected),
             column_name=column_name,
         )
 
 
 class ColumnsDriftParameters(ConditionTestParameters):
+    class Config:
+        copy_on_model_validation = "none"
+
+    validate_on_build: ClassVar[bool] = False
+
     # todo: rename to columns?
     features: Dict[str, ColumnDriftParameter]
+    _df: Optional[pd.DataFrame] = None
 
     @classmethod
     def from_data_drift_table(cls, table: DataDriftTableResults, condition: TestValueCondition):
-        return ColumnsDriftParameters(
-            features={
-                feature: ColumnDriftParameter.from_metric(data) for feature, data in table.drift_by_columns.items()
-            },
+        build = cls if cls.validate_on_build else cls.construct
+        from_metric = ColumnDriftParameter.from_metric
+        return build(
+            features={feature: from_metric(data) for feature, data in table.drift_by_columns.items()},
             condition=condition,
         )
 
     def to_dataframe(self) -> pd.DataFrame:
-        return pd.DataFrame(
-            [
-                {
-                    "Feature name": feature,
-                    "Stattest": data.stattest,
-                    "Drift score": data.score,
-                    "Threshold": data.threshold,
-                    "Data Drift": "Detected" if data.detected else "Not detected",
-                }
-                for feature, data in self.features.items()
-            ],
+        if self._df is not None:
+            return self._df
+        # build typed columns instead of per-row dicts so pandas skips type inference
+        n = len(self.features)
+        names = list(self.features)
+        stattests = [data.stattest for data in self.features.values()]
+        scores = np.fromiter((data.score for data in self.features.values()), dtype=np.float64, count=n)
+        thresholds = np.fromiter((data.threshold for data in self.features.values()), dtype=np.float64, count=n)
+        detected = np.fromiter((data.detected for data in self.features.values()), dtype=bool, count=n)
+        self._df = pd.DataFrame(
+            {
+                "Feature name": names,
+                "Stattest": stattests,
+                "Drift score": scores,
+                "Threshold": thresholds,
+                # categorical stores int codes instead of repeated strings and sorts on them
+                "Data Drift": pd.Categorical.from_codes(
+                    codes=(~detected).astype(np.int8), categories=["Detected", "Not detected"]
+                ),
+            },
         )
+        return self._df
 
 
 class BaseDataDriftMetricsTest(BaseCheckValueTest, ABC):
     group: ClassVar = DATA_DRIFT_GROUP.id
     _metric: DataDriftTable
+    _cached_result: Optional[DataDriftTableResults] = None
+    _cached_condition: Optional[TestValueCondition] = None
 
     def __init__(
         self,
@@ -147,9 +188,21 @@ class BaseDataDriftMetricsTest(BaseCheckValueTest, ABC):
     def metric(self):
         return self._metric
 
+    @property
+    def cached_result(self) -> DataDriftTableResults:
+        if self._cached_result is None:
+            self._cached_result = self.metric.get_result()
+        return self._cached_result
+
+    def set_context(self, context):
+        # a new run invalidates the cached metric result and derived condition
+        self._cached_result = None
+        self._cached_condition = None
+        super().set_context(context)
+
     def check(self):
         result = super().check()
-        metrics = self.metric.get_result()
+        metrics = self.cached_result
 
         return TestResult(
             name=result.name,
@@ -164,16 +217,18 @@ class TestNumberOfDriftedColumns(BaseDataDriftMetricsTest):
     name: ClassVar = "Number of Drifted Features"
 
     def get_condition(self) -> TestValueCondition:
-        if self.condition.has_condition():
-            return self.condition
-        else:
-            return TestValueCondition(lt=max(0, self.metric.get_result().number_of_columns // 3))
+        if self._cached_condition is None:
+            condition = self.condition
+            if not condition.has_condition():
+                condition = TestValueCondition(lt=max(0, self.cached_result.number_of_columns // 3))
+            self._cached_condition = condition
+        return self._cached_condition
 
     def calculate_value_for_test(self) -> Numeric:
-        return self.metric.get_result().number_of_drifted_columns
+        return self.cached_result.number_of_drifted_columns
 
     def get_description(self, value: Numeric) -> str:
-        n_features = self.metric.get_result().number_of_columns
+        n_features = self.cached_result.number_of_columns
         return (
             f"The drift is detected for {value} out of {n_features} features. "
             f"The test threshold is {self.get_condition()}."
@@ -184,17 +239,19 @@ class TestShareOfDriftedColumns(BaseDataDriftMetricsTest):
     name: ClassVar = "Share of Drifted Columns"
 
     def get_condition(self) -> TestValueCondition:
-        if self.condition.has_condition():
-            return self.condition
-        else:
-            return TestValueCondition(lt=0.3)
+        if self._cached_condition is None:
+            condition = self.condition
+            if not condition.has_condition():
+                condition = TestValueCondition(lt=0.3)
+            self._cached_condition = condition
+        return self._cached_condition
 
     def calculate_value_for_test(self) -> Numeric:
-        return self.metric.get_result().share_of_drifted_columns
+        return self.cached_result.share_of_drifted_columns
 
     def get_description(self, value: Numeric) -> str:
-        n_drifted_features = self.metric.get_result().number_of_drifted_columns
-        n_features = self.metric.get_result().number_of_columns
+        n_drifted_features = self.cached_result.number_of_drifted_columns
+        n_features = self.cached_result.number_of_columns
         return (
             f"The drift is detected for {value * 100:.3g}% features "
             f"({n_drifted_features} out of {n_features}). The test threshold is {self.get_condition()}"
@@ -205,6 +262,7 @@ class TestColumnDrift(Test):
     name: ClassVar = "Drift per Column"
     group: ClassVar = DATA_DRIFT_GROUP.id
     _metric: ColumnDriftMetric
+    _cached_result: Optional[ColumnDataDriftMetrics] = None
     column_name: ColumnName
     stattest: Optional[PossibleStatTestType] = None
     stattest_threshold: Optional[float] = None
@@ -216,12 +274,13 @@ class TestColumnDrift(Test):
         stattest_threshold: Optional[float] = None,
         is_critical: bool = True,
     ):
-        self.column_name = ColumnName.from_any(column_name)
+        column = ColumnName.from_any(column_name)
+        self.column_name = column
         self.stattest = stattest
         self.stattest_threshold = stattest_threshold
 
         self._metric = ColumnDriftMetric(
-            column_name=column_name,
+            column_name=column,
             stattest=stattest,
             stattest_threshold=stattest_threshold,
         )
@@ -231,23 +290,29 @@ class TestColumnDrift(Test):
     def metric(self):
         return self._metric
 
-    def check(self):
-        drift_info = self.metric.get_result()
+    @property
+    def cached_result(self) -> ColumnDataDriftMetrics:
+        if self._cached_result is None:
+            self._cached_result = self.metric.get_result()
+        return self._cached_result
 
-        p_value = np.round(drift_info.drift_score, 3)
-        stattest_name = drift_info.stattest_name
-        threshold = drift_info.stattest_threshold
-        description = (
-            f"The drift score for the feature **{self.column_name.display_name}** is {p_value:.3g}. "
-            f"The drift detection method is {stattest_name}. "
-            f"The drift detection threshold is {threshold}."
-        )
+    def set_context(self, context):
+        # a new run invalidates the cached metric result
+        self._cached_result = None
+        super().set_context(context)
 
-        if not drift_info.drift_detected:
-            result_status = TestStatus.SUCCESS
+    def check(self):
+        drift_info = self.cached_result
+
+        display_name = self.column_name.display_name
+        description = _COLUMN_DRIFT_DESCRIPTION.format(
+            name=display_name,
+            score=drift_info.rounded_score,
+            stattest=drift_info.stattest_name,
+            threshold=drift_info.stattest_threshold,
+        )
 
-        else:
-            result_status = TestStatus.FAIL
+        result_status = _STATUS_BY_DETECTED[bool(drift_info.drift_detected)]
 
         return TestResult(
             name=self.name,
@@ -255,12 +320,148 @@ class TestColumnDrift(Test):
             status=result_status,
             group=self.group,
             groups={
-                GroupingTypes.ByFeature.id: self.column_name.display_name,
+                GroupingTypes.ByFeature.id: display_name,
             },
-            parameters=ColumnDriftParameter.from_metric(drift_info, column_name=self.column_name.display_name),
+            parameters=ColumnDriftParameter.from_metric(drift_info, column_name=display_name),
         )
 
 
+class TestColumnDriftFromTable(TestColumnDrift):
+    """Column drift test backed by a shared DataDriftTable calculation.
+
+    All tests generated for one run reference an equal DataDriftTable metric,
+    so the suite calculates the table once and every per-column test reads its
+    own entry from `drift_by_columns` instead of running a separate metric.
+    """
+
+    _metric: Union[DataDriftTable, ColumnDriftMetric]  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        column_name: Union[str, ColumnName],
+        table: Optional[DataDriftTable] = None,
+        stattest: Optional[PossibleStatTestType] = None,
+        stattest_threshold: Optional[float] = None,
+        is_critical: bool = True,
+    ):
+        if table is None:
+            # the shared table is not serialized: when loaded back from a
+            # snapshot the test falls back to its own per-column metric
+            super().__init__(
+                column_name=column_name,
+                stattest=stattest,
+                stattest_threshold=stattest_threshold,
+                is_critical=is_critical,
+            )
+            return
+        self.column_name = ColumnName.from_any(column_name)
+        self.stattest = stattest
+        self.stattest_threshold = stattest_threshold
+        self._metric = table
+        # skip TestColumnDrift.__init__: the metric is the shared table
+        Test.__init__(self, is_critical=is_critical)
+
+    @property
+    def cached_result(self) -> ColumnDataDriftMetrics:
+        if self._cached_result is None:
+            display_name = self.column_name.display_name
+            try:
+                result = self.metric.get_result()
+            except ValueError:
+                # reloaded from a snapshot: the rebuilt fallback metric was
+                # never run, so read the column from the stored table result
+                result = self._table_result_from_context()
+            if isinstance(result, DataDriftTableResults):
+                drift = result.drift_by_columns.get(display_name)
+                if drift is None:
+                    raise ValueError(f"Drift calculation failed for column '{display_name}'")
+                result = drift
+            self._cached_result = result
+        return self._cached_result
+
+    def _table_result_from_context(self) -> DataDriftTableResults:
+        display_name = self.column_name.display_name
+        if self._context is not None:
+            for result in self._context.metric_results.values():
+                if isinstance(result, DataDriftTableResults) and display_name in result.drift_by_columns:
+                    return result
+        raise ValueError(f"No drift result found for column '{display_name}'")
+
+
+class ColumnsDriftTable(DataDriftTable):
+    """DataDriftTable that keeps per-column failures contained.
+
+    Used by the drift test generators: a column that cannot be calculated is
+    left out of the result, so it errors only its own test instead of failing
+    the whole shared table.
+    """
+
+    def calculate(self, data: InputData) -> DataDriftTableResults:
+        if data.reference_data is None:
+            raise ValueError("Reference dataset should be present")
+        if self.columns is None:
+            return super().calculate(data)
+
+        if self.get_options().render_options.raw_data:
+            agg_data = False
+        else:
+            agg_data = True
+
+        dataset_columns = process_columns(data.reference_data, data.column_mapping)
+        drift_by_columns = {}
+        for column_name in self.columns:
+            try:
+                drift_by_columns[column_name] = get_one_column_drift(
+                    current_data=data.current_data,
+                    reference_data=data.reference_data,
+                    column_name=column_name,
+                    options=self.drift_options,
+                    dataset_columns=dataset_columns,
+                    agg_data=agg_data,
+                )
+            except ValueError:
+                # the failed column errors only its own test,
+                # see TestColumnDriftFromTable.cached_result
+                continue
+        if drift_by_columns:
+            dataset_drift = get_dataset_drift(drift_by_columns, self.drift_options.drift_share)
+            number_of_drifted_columns = dataset_drift.number_of_drifted_columns
+            share_of_drifted_columns = dataset_drift.dataset_drift_score
+            drift_detected = dataset_drift.dataset_drift
+        else:
+            number_of_drifted_columns = 0
+            share_of_drifted_columns = 0.0
+            drift_detected = False
+        return DataDriftTableResults(
+            number_of_columns=len(self.columns),
+            number_of_drifted_columns=number_of_drifted_columns,
+            share_of_drifted_columns=share_of_drifted_columns,
+            dataset_drift=drift_detected,
+            drift_by_columns=drift_by_columns,
+            dataset_columns=dataset_columns,
+        )
+
+
+default_renderer(wrap_type=ColumnsDriftTable)(DataDriftTableRenderer)
+
+
+def _bind_stattest_resolver(generator: Union["TestAllFeaturesValueDrift", "TestCustomFeaturesValueDrift"]) -> Callable:
+    """Bind stattest and threshold settings of a generator to `resolve_stattest_threshold`."""
+    return partial(
+        resolve_stattest_threshold,
+        stattest=generator.stattest,
+        cat_stattest=generator.cat_stattest,
+        num_stattest=generator.num_stattest,
+        text_stattest=generator.text_stattest,
+        per_column_stattest=generator.per_column_stattest,
+        stattest_threshold=generator.stattest_threshold,
+        cat_stattest_threshold=generator.cat_stattest_threshold,
+        num_stattest_threshold=generator.num_stattest_threshold,
+        text_stattest_threshold=generator.text_stattest_threshold,
+        per_column_stattest_threshold=generator.per_column_stattest_threshold,
+    )
+
+
 class TestAllFeaturesValueDrift(BaseGenerator):
     """Create value drift tests for numeric and category features"""
 
@@ -305,83 +506,49 @@ class TestAllFeaturesValueDrift(BaseGenerator):
         self.per_column_stattest_threshold = per_column_stattest_threshold
 
     def generate(self, columns_info: DatasetColumns) -> List[TestColumnDrift]:
-        results = []
-        for name in columns_info.cat_feature_names:
-            if self.columns and name not in self.columns:
-                continue
-            stattest, threshold = resolve_stattest_threshold(
-                name,
-                "cat",
-                self.stattest,
-                self.cat_stattest,
-                self.num_stattest,
-                self.text_stattest,
-                self.per_column_stattest,
-                self.stattest_threshold,
-                self.cat_stattest_threshold,
-                self.num_stattest_threshold,
-                self.text_stattest_threshold,
-                self.per_column_stattest_threshold,
-            )
-            results.append(
-                TestColumnDrift(
-                    column_name=name,
-                    stattest=stattest,
-                    stattest_threshold=threshold,
-                    is_critical=self.is_critical,
-                )
-            )
-        for name in columns_info.num_feature_names:
-            if self.columns and name not in self.columns:
-                continue
-            stattest, threshold = resolve_stattest_threshold(
-                name,
-                "num",
-                self.stattest,
-                self.cat_stattest,
-                self.num_stattest,
-                self.text_stattest,
-                self.per_column_stattest,
-                self.stattest_threshold,
-                self.cat_stattest_threshold,
-                self.num_stattest_threshold,
-                self.text_stattest_threshold,
-                self.per_column_stattest_threshold,
-            )
-            results.append(
-                TestColumnDrift(
-                    column_name=name,
-                    stattest=stattest,
-                    stattest_threshold=threshold,
-                    is_critical=self.is_critical,
-                )
+        columns_filter = set(self.columns) if self.columns else None
+        is_critical = self.is_critical
+        resolve = _bind_stattest_resolver(self)
+        names_with_types = [
+            (name, feature_type)
+            for feature_type, type_names in (
+                ("cat", columns_info.cat_feature_names),
+                ("num", columns_info.num_feature_names),
+                ("text", columns_info.text_feature_names),
             )
-        for name in columns_info.text_feature_names:
-            if self.columns and name not in self.columns:
-                continue
-            stattest, threshold = resolve_stattest_threshold(
-                name,
-                "text",
-                self.stattest,
-                self.cat_stattest,
-                self.num_stattest,
-                self.text_stattest,
-                self.per_column_stattest,
-                self.stattest_threshold,
-                self.cat_stattest_threshold,
-                self.num_stattest_threshold,
-                self.text_stattest_threshold,
-                self.per_column_stattest_threshold,
-            )
-            results.append(
-                TestColumnDrift(
+            for name in type_names
+            if columns_filter is None or name in columns_filter
+        ]
+        # one shared table computes drift for every column in a single pass;
+        # stattest/threshold resolution happens inside the table per column
+        table = ColumnsDriftTable(
+            columns=[name for name, _ in names_with_types],
+            stattest=self.stattest,
+            cat_stattest=self.cat_stattest,
+            num_stattest=self.num_stattest,
+            text_stattest=self.text_stattest,
+            per_column_stattest=self.per_column_stattest,
+            stattest_threshold=self.stattest_threshold,
+            cat_stattest_threshold=self.cat_stattest_threshold,
+            num_stattest_threshold=self.num_stattest_threshold,
+            text_stattest_threshold=self.text_stattest_threshold,
+            per_column_stattest_threshold=self.per_column_stattest_threshold,
+        )
+        tests: List[TestColumnDrift] = []
+        for name, feature_type in names_with_types:
+            # the resolved stattest is persisted on the test so that reloading
+            # it from a snapshot keeps the configured settings
+            stattest, threshold = resolve(name, feature_type)
+            tests.append(
+                TestColumnDriftFromTable(
                     column_name=name,
+                    table=table,
                     stattest=stattest,
                     stattest_threshold=threshold,
-                    is_critical=self.is_critical,
+                    is_critical=is_critical,
                 )
             )
-        return results
+        return tests
 
 
 class TestCustomFeaturesValueDrift(BaseGenerator):
@@ -428,34 +595,28 @@ class TestCustomFeaturesValueDrift(BaseGenerator):
         self.per_feature_threshold = per_column_stattest_threshold
 
     def generate(self, columns_info: DatasetColumns) -> List[TestColumnDrift]:
-        result = []
+        resolve = _bind_stattest_resolver(self)
+        cat_features = set(columns_info.cat_feature_names)
+        text_features = set(columns_info.text_feature_names)
+        is_critical = self.is_critical
+        result: List[TestColumnDrift] = []
+        append = result.append
         for name in self.features:
-            stattest, threshold = resolve_stattest_threshold(
-                name,
-                "cat"
-                if name in columns_info.cat_feature_names
-                else "num"
-                if columns_info.num_feature_names
-                else "text"
-                if columns_info.text_feature_names
-                else "datetime",
-                self.stattest,
-                self.cat_stattest,
-                self.num_stattest,
-                self.text_stattest,
-                self.per_column_stattest,
-                self.stattest_threshold,
-                self.cat_stattest_threshold,
-                self.num_stattest_threshold,
-                self.text_stattest_threshold,
-                self.per_column_stattest_threshold,
-            )
-            result.append(
+            if name in cat_features:
+                feature_type = "cat"
+            elif name in text_features:
+                feature_type = "text"
+            else:
+                # target, prediction and datetime columns are not listed among
+                # the features; resolve them like numerical columns
+                feature_type = "num"
+            stattest, threshold = resolve(name, feature_type)
+            append(
                 TestColumnDrift(
                     column_name=name,
                     stattest=stattest,
                     stattest_threshold=threshold,
-                    is_critical=self.is_critical,
+                    is_critical=is_critical,
                 )
             )
         return result
@@ -470,11 +631,10 @@ class TestNumberOfDriftedColumnsRenderer(TestRenderer):
             return info
         parameters = result.parameters
         assert isinstance(parameters, ColumnsDriftParameters)
-        df = parameters.to_dataframe()
-        df = df.sort_values("Data Drift")
+        df = parameters.to_dataframe().sort_values("Data Drift")
         info.with_details(
             title="Drift Table",
-            info=table_data(column_names=df.columns.to_list(), data=df.values),
+            info=table_data(column_names=list(df.columns), data=list(df.itertuples(index=False, name=None))),
         )
         return info
 
@@ -488,8 +648,7 @@ class TestShareOfDriftedColumnsRenderer(TestRenderer):
             return info
         parameters = result.parameters
         assert isinstance(parameters, ColumnsDriftParameters)
-        df = parameters.to_dataframe()
-        df = df.sort_values("Data Drift")
+        df = parameters.to_dataframe().sort_values("Data Drift")
         info.details = [
             DetailsInfo(
                 id="drift_table",
@@ -497,7 +656,7 @@ class TestShareOfDriftedColumnsRenderer(TestRenderer):
                 info=BaseWidgetInfo(
                     title="",
                     type="table",
-                    params={"header": df.columns.to_list(), "data": df.values},
+                    params={"header": list(df.columns), "data": list(df.itertuples(index=False, name=None))},
                     size=2,
                 ),
             ),
@@ -508,11 +667,19 @@ class TestShareOfDriftedColumnsRenderer(TestRenderer):
 @default_renderer(wrap_type=TestColumnDrift)
 class TestColumnDriftRenderer(TestRenderer):
     def render_html(self, obj: TestColumnDrift) -> TestHtmlInfo:
+        # imported lazily so batch runs that never render skip the plotting stack
+        from evidently.renderers.html_widgets import plotly_figure
+        from evidently.utils.visualizations import plot_distr_with_cond_perc_button
+
         info = super().render_html(obj)
-        result = obj.metric.get_result()
+        if obj.get_result().status == TestStatus.ERROR:
+            return info
+        result = obj.cached_result
         column_name = obj.column_name
         if result.column_type == "text":
             if result.current.characteristic_words is not None and result.reference.characteristic_words is not None:
+                current_words = result.current.characteristic_words
+                reference_words = result.reference.characteristic_words
                 info.details = [
                     DetailsInfo(
                         id=f"{column_name} dritf curr",
@@ -522,7 +689,7 @@ class TestColumnDriftRenderer(TestRenderer):
                             type="table",
                             params={
                                 "header": ["", ""],
-                                "data": [[el, ""] for el in result.current.characteristic_words],
+                                "data": list(zip(current_words, repeat(""))),
                             },
                             size=2,
                         ),
@@ -535,7 +702,7 @@ class TestColumnDriftRenderer(TestRenderer):
                             type="table",
                             params={
                                 "header": ["", ""],
-                                "data": [[el, ""] for el in result.reference.characteristic_words],
+                                "data": list(zip(reference_words, repeat(""))),
                             },
                             size=2,
                         ),
@@ -560,6 +727,11 @@ class TestColumnDriftRenderer(TestRenderer):
         return info
 
 
+@default_renderer(wrap_type=TestColumnDriftFromTable)
+class TestColumnDriftFromTableRenderer(TestColumnDriftRenderer):
+    pass
+
+
 class TestEmbeddingsDrift(Test):
     name: ClassVar = "Drift for embeddings"
     group: ClassVar = DATA_DRIFT_GROUP.id
@@ -591,11 +763,7 @@ class TestEmbeddingsDrift(Test):
             f"The drift score for the embedding set **{drift_info.embeddings_name}** is {drift_score:.3g}. "
             f"The drift detection method is **{drift_info.method_name}**. "
         )
-        if not drift_info.drift_detected:
-            result_status = TestStatus.SUCCESS
-
-        else:
-            result_status = TestStatus.FAIL
+        result_status = _STATUS_BY_DETECTED[bool(drift_info.drift_detected)]
         return TestResult(
             name=self.name,
             description=description,
@@ -607,6 +775,9 @@ class TestEmbeddingsDrift(Test):
 @default_renderer(wrap_type=TestEmbeddingsDrift)
 class TestEmbeddingsDriftRenderer(TestRenderer):
     def render_html(self, obj: TestEmbeddingsDrift) -> TestHtmlInfo:
+        from evidently.renderers.html_widgets import plotly_figure
+        from evidently.utils.visualizations import plot_contour_single
+
         info = super().render_html(obj)
         result = obj.metric.get_result()
         fig = plot_contour_single(result.current, result.reference, "component 1", "component 2")
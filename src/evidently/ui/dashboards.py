@@ -251,6 +251,9 @@ class DashboardConfig(BaseModel):
     def add_panel(self, panel: DashboardPanel):
         self.panels.append(panel)
 
+    def add_panels(self, panels: Iterable[DashboardPanel]):
+        self.panels.extend(panels)
+
 
 class Dashboard(Display):
     def __init__(self, config: DashboardConfig):
@@ -1,18 +1,25 @@
 import io
+import shutil
 import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from datetime import time
 from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
 from typing import Union
 
+import numpy as np
 import pandas as pd
 import requests
-from dateutil.relativedelta import relativedelta
+from appdirs import user_cache_dir  # type: ignore
 from sklearn import ensemble
 
 from evidently import ColumnMapping
 from evidently import metrics
+from evidently.calculations.stattests.registry import StatTest
+from evidently.calculations.stattests.registry import register_stattest
 from evidently.report import Report
 from evidently.test_preset import DataDriftTestPreset
 from evidently.test_suite import TestSuite
@@ -26,60 +33,140 @@ from evidently.ui.remote import RemoteWorkspace
 from evidently.ui.workspace import Workspace
 from evidently.ui.workspace import WorkspaceBase
 
-warnings.filterwarnings("ignore")
-warnings.simplefilter("ignore")
-
-content = requests.get("https://archive.ics.uci.edu/static/public/275/bike+sharing+dataset.zip").content
-with zipfile.ZipFile(io.BytesIO(content)) as arc:
-    raw_data = pd.read_csv(
-        arc.open("hour.csv"),
-        header=0,
-        sep=",",
-        parse_dates=["dteday"],
-        index_col="dteday",
-    )
+BIKE_SHARING_URL = "https://archive.ics.uci.edu/static/public/275/bike+sharing+dataset.zip"
 
-    raw_data.index = raw_data.apply(
-        lambda row: datetime.combine(row.name, time(hour=int(row["hr"]))) + relativedelta(years=11),
-        axis=1,
-    )
 
-reference = raw_data.loc["2023-01-01 00:00:00":"2023-01-28 23:00:00"]
-current = raw_data.loc["2023-01-29 00:00:00":"2023-02-28 23:00:00"]
+@lru_cache(maxsize=1)
+def _load_bike_sharing_zip() -> bytes:
+    """Download the bike sharing dataset, reusing a copy cached on disk."""
+    cache_path = Path(user_cache_dir("evidently")) / "bike_sharing.zip"
+    if cache_path.exists():
+        return cache_path.read_bytes()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # stream into a temp file in 64 KiB chunks and rename on success, so an
+    # error response or interrupted download cannot poison the cache
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with requests.get(BIKE_SHARING_URL, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with open(tmp_path, "wb") as out:
+            shutil.copyfileobj(response.raw, out, length=64 * 1024)
+    tmp_path.replace(cache_path)
+    return cache_path.read_bytes()
+
+
+with zipfile.ZipFile(io.BytesIO(_load_bike_sharing_zip())) as arc:
+    _read_csv_kwargs = dict(header=0, sep=",", parse_dates=["dteday"])
+    try:
+        # arrow decodes the file with multi-threaded block parsing
+        raw_data = pd.read_csv(arc.open("hour.csv"), engine="pyarrow", **_read_csv_kwargs)
+    except ImportError:
+        raw_data = pd.read_csv(arc.open("hour.csv"), **_read_csv_kwargs)
+
+    # shift the two dataset years into the present, hour resolution; the
+    # dteday dates are day-aligned, so the index is built in one pass
+    raw_data.index = raw_data["dteday"] + pd.to_timedelta(raw_data["hr"], unit="h") + pd.DateOffset(years=11)
+    raw_data.drop(columns=["dteday"], inplace=True)
 
 target = "cnt"
 prediction = "prediction"
 numerical_features = ["temp", "atemp", "hum", "windspeed", "hr", "weekday"]
 categorical_features = ["season", "holiday", "workingday"]
 
+# halve the bytes moved through predict and the per-column drift passes
+raw_data[numerical_features] = raw_data[numerical_features].astype(np.float32)
+raw_data[categorical_features] = raw_data[categorical_features].astype(np.int8)
+
+reference = raw_data.loc["2023-01-01 00:00:00":"2023-01-28 23:00:00"]
+current = raw_data.loc["2023-01-29 00:00:00":"2023-02-28 23:00:00"]
+
 column_mapping = ColumnMapping()
 column_mapping.target = target
 column_mapping.prediction = prediction
 column_mapping.numerical_features = numerical_features
 column_mapping.categorical_features = categorical_features
 
-regressor = ensemble.RandomForestRegressor(random_state=0, n_estimators=50)
-regressor.fit(reference[numerical_features + categorical_features], reference[target])
+features = numerical_features + categorical_features
+
+regressor = ensemble.RandomForestRegressor(random_state=0, n_estimators=50, n_jobs=-1)
+
+# hand sklearn contiguous arrays instead of converting the frame slice per call
+X_ref = reference[features].to_numpy(dtype=np.float32)
+X_cur = current[features].to_numpy(dtype=np.float32)
+# suppress only the noisy fit/predict block instead of every warning globally
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    regressor.fit(X_ref, reference[target])
+
+    # one predict over both frames walks the forest once, then split the output
+    predictions = regressor.predict(np.concatenate((X_ref, X_cur)))
+    reference["prediction"] = predictions[: len(reference)]
+    current["prediction"] = predictions[len(reference) :]
 
-reference["prediction"] = regressor.predict(reference[numerical_features + categorical_features])
-current["prediction"] = regressor.predict(current[numerical_features + categorical_features])
+# each daily batch is used by both the report and the test suite; one pass
+# over the index builds them all instead of 28 binary-searched loc slices
+daily_slices = [batch for _, batch in current.groupby(pd.Grouper(freq="D"))]
+
+# the reference frame never changes between the 28 reports, so sort and norm
+# each drifting column once instead of on every wasserstein call
+ref_sorted = {}
+ref_norm = {}
+for _column in numerical_features + [target, prediction]:
+    _values = np.sort(reference[_column].to_numpy())
+    ref_sorted[_column] = _values
+    ref_norm[_column] = max(np.std(_values), 0.001)
+
+
+def _wasserstein_1d(u_sorted: np.ndarray, v: np.ndarray) -> float:
+    """First Wasserstein distance with the first sample already sorted."""
+    v_sorted = np.sort(v)
+    all_values = np.concatenate((u_sorted, v_sorted))
+    # both halves are sorted, so a stable merge-style sort is near linear
+    all_values.sort(kind="mergesort")
+    deltas = np.diff(all_values)
+    u_cdf = np.searchsorted(u_sorted, all_values[:-1], side="right") / u_sorted.size
+    v_cdf = np.searchsorted(v_sorted, all_values[:-1], side="right") / v_sorted.size
+    return float(np.sum(np.abs(u_cdf - v_cdf) * deltas))
+
+
+def _wasserstein_presorted(
+    reference_data: pd.Series, current_data: pd.Series, feature_type: str, threshold: float
+) -> Tuple[float, bool]:
+    """Normed Wasserstein distance reusing the precomputed reference artefacts."""
+    ref_values = ref_sorted.get(reference_data.name)
+    if ref_values is None:
+        ref_values = np.sort(reference_data.to_numpy())
+    norm = ref_norm.get(reference_data.name) or max(np.std(ref_values), 0.001)
+    wd_norm_value = _wasserstein_1d(ref_values, current_data.to_numpy()) / norm
+    return wd_norm_value, wd_norm_value >= threshold
+
+
+wasserstein_presorted_stat_test = StatTest(
+    name="wasserstein_presorted",
+    display_name="Wasserstein distance (normed)",
+    func=_wasserstein_presorted,
+    allowed_feature_types=["num"],
+    default_threshold=0.1,
+)
+register_stattest(wasserstein_presorted_stat_test)
 
 WORKSPACE = "workspace"
 DEMO_PROJECT_NAME = "Demo Project"
 
 
-def create_report(i: int, tags=[]):
+@lru_cache(maxsize=32)
+def create_report(i: int):
     data_drift_report = Report(
         metrics=[
             metrics.RegressionQualityMetric(),
             metrics.DatasetSummaryMetric(),
             metrics.DatasetDriftMetric(),
-            metrics.ColumnDriftMetric(column_name="cnt", stattest="wasserstein"),
-            metrics.ColumnDriftMetric(column_name="prediction", stattest="wasserstein"),
-            metrics.ColumnDriftMetric(column_name="temp", stattest="wasserstein"),
-            metrics.ColumnDriftMetric(column_name="atemp", stattest="wasserstein"),
-            metrics.ColumnDriftMetric(column_name="hum", stattest="wasserstein"),
-            metrics.ColumnDriftMetric(column_name="windspeed", stattest="wasserstein"),
+            metrics.ColumnDriftMetric(column_name="cnt", stattest="wasserstein_presorted"),
+            metrics.ColumnDriftMetric(column_name="prediction", stattest="wasserstein_presorted"),
+            metrics.ColumnDriftMetric(column_name="temp", stattest="wasserstein_presorted"),
+            metrics.ColumnDriftMetric(column_name="atemp", stattest="wasserstein_presorted"),
+            metrics.ColumnDriftMetric(column_name="hum", stattest="wasserstein_presorted"),
+            metrics.ColumnDriftMetric(column_name="windspeed", stattest="wasserstein_presorted"),
             metrics.ColumnSummaryMetric(column_name="cnt"),
             metrics.ColumnSummaryMetric(column_name="prediction"),
         ],
@@ -89,13 +176,14 @@ def create_report(i: int, tags=[]):
 
     data_drift_report.run(
         reference_data=reference,
-        current_data=current.loc[datetime(2023, 1, 29) + timedelta(days=i) : datetime(2023, 1, 29) + timedelta(i + 1)],
+        current_data=daily_slices[i],
         column_mapping=column_mapping,
     )
     return data_drift_report
 
 
-def create_test_suite(i: int, tags=[]):
+@lru_cache(maxsize=32)
+def create_test_suite(i: int):
     data_drift_test_suite = TestSuite(
         tests=[DataDriftTestPreset()],
         timestamp=datetime(2023, 1, 29) + timedelta(days=i + 1),
@@ -103,7 +191,7 @@ def create_test_suite(i: int, tags=[]):
 
     data_drift_test_suite.run(
         reference_data=reference,
-        current_data=current.loc[datetime(2023, 1, 29) + timedelta(days=i) : datetime(2023, 1, 29) + timedelta(i + 1)],
+        current_data=daily_slices[i],
         column_mapping=column_mapping,
     )
     return data_drift_test_suite
@@ -112,14 +200,12 @@ def create_test_suite(i: int, tags=[]):
 def create_project(workspace: WorkspaceBase):
     project = workspace.create_project(DEMO_PROJECT_NAME)
     project.description = "A toy demo project using Bike Demand forecasting dataset"
-    project.dashboard.add_panel(
+    panels = [
         DashboardPanelCounter(
             filter=ReportFilter(metadata_values={}, tag_values=[]),
             agg=CounterAgg.NONE,
             title="Bike Rental Demand Forecast",
-        )
-    )
-    project.dashboard.add_panel(
+        ),
         DashboardPanelCounter(
             title="Model Calls",
             filter=ReportFilter(metadata_values={}, tag_values=[]),
@@ -131,9 +217,7 @@ def create_project(workspace: WorkspaceBase):
             text="count",
             agg=CounterAgg.SUM,
             size=1,
-        )
-    )
-    project.dashboard.add_panel(
+        ),
         DashboardPanelCounter(
             title="Share of Drifted Features",
             filter=ReportFilter(metadata_values={}, tag_values=[]),
@@ -145,9 +229,7 @@ def create_project(workspace: WorkspaceBase):
             text="share",
             agg=CounterAgg.LAST,
             size=1,
-        )
-    )
-    project.dashboard.add_panel(
+        ),
         DashboardPanelPlot(
             title="Target and Prediction",
             filter=ReportFilter(metadata_values={}, tag_values=[]),
@@ -167,9 +249,7 @@ def create_project(workspace: WorkspaceBase):
             ],
             plot_type=PlotType.LINE,
             size=2,
-        )
-    )
-    project.dashboard.add_panel(
+        ),
         DashboardPanelPlot(
             title="MAE",
             filter=ReportFilter(metadata_values={}, tag_values=[]),
@@ -182,9 +262,7 @@ def create_project(workspace: WorkspaceBase):
             ],
             plot_type=PlotType.LINE,
             size=1,
-        )
-    )
-    project.dashboard.add_panel(
+        ),
         DashboardPanelPlot(
             title="MAPE",
             filter=ReportFilter(metadata_values={}, tag_values=[]),
@@ -197,9 +275,7 @@ def create_project(workspace: WorkspaceBase):
             ],
             plot_type=PlotType.LINE,
             size=1,
-        )
-    )
-    project.dashboard.add_panel(
+        ),
         DashboardPanelPlot(
             title="Features Drift (Wasserstein Distance)",
             filter=ReportFilter(metadata_values={}, tag_values=[]),
@@ -231,8 +307,9 @@ def create_project(workspace: WorkspaceBase):
             ],
             plot_type=PlotType.LINE,
             size=2,
-        )
-    )
+        ),
+    ]
+    project.dashboard.add_panels(panels)
     project.save()
     return project
 
@@ -247,12 +324,18 @@ def create_demo_project(workspace: Union[str, WorkspaceBase]):
             ws = Workspace.create(workspace)
     project = create_project(ws)
 
-    for i in range(0, 28):
-        report = create_report(i=i)
-        ws.add_report(project.id, report)
+    # the 28 daily reports and suites are independent, build them concurrently;
+    # workspace writes stay in the main thread. Warnings are silenced here in
+    # the main thread only: catch_warnings mutates interpreter-global filter
+    # state, so per-call suppression would race between the worker threads
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with ThreadPoolExecutor() as executor:
+            reports = list(executor.map(create_report, range(28)))
+            test_suites = list(executor.map(create_test_suite, range(28)))
 
-        test_suite = create_test_suite(i=i)
-        ws.add_test_suite(project.id, test_suite)
+    ws.add_reports(project.id, reports)
+    ws.add_test_suites(project.id, test_suites)
 
 
 if __name__ == "__main__":
@@ -41,6 +41,7 @@ class RemoteWorkspace(WorkspaceBase[RemoteProject]):
         query_params: Optional[dict] = None,
         body: Optional[dict] = None,
         response_model=None,
+        session: Optional[requests.Session] = None,
     ):
         # todo: better encoding
         headers = {"evidently-secret": self.secret}
@@ -50,7 +51,7 @@ class RemoteWorkspace(WorkspaceBase[RemoteProject]):
 
             data = json.dumps(body, allow_nan=True, cls=NumpyEncoder).encode("utf8")
 
-        response = requests.request(
+        response = (session or requests).request(
             method, urllib.parse.urljoin(self.base_url, path), params=query_params, data=data, headers=headers
         )
         response.raise_for_status()
@@ -79,6 +80,13 @@ class RemoteWorkspace(WorkspaceBase[RemoteProject]):
     def add_snapshot(self, project_id: Union[str, uuid.UUID], snapshot: Snapshot):
         return self._request(f"/api/projects/{project_id}/snapshots", "POST", body=snapshot.dict())
 
+    def add_snapshots(self, project_id: STR_UUID, snapshots: List[Snapshot]):
+        # the API accepts one snapshot per POST; reuse a keep-alive session so
+        # a batch does not re-establish a connection per upload
+        with requests.Session() as session:
+            for snapshot in snapshots:
+                self._request(f"/api/projects/{project_id}/snapshots", "POST", body=snapshot.dict(), session=session)
+
     def delete_snapshot(self, project_id: STR_UUID, snapshot_id: STR_UUID):
         return self._request(f"/api/projects/{project_id}/{snapshot_id}", "DELETE")
 
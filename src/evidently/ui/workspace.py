@@ -244,13 +244,23 @@ class WorkspaceBase(abc.ABC, Generic[PT]):
     def add_report(self, project_id: STR_UUID, report: Report):
         self.add_snapshot(project_id, report.to_snapshot())
 
+    def add_reports(self, project_id: STR_UUID, reports: List[Report]):
+        self.add_snapshots(project_id, [report.to_snapshot() for report in reports])
+
     def add_test_suite(self, project_id: STR_UUID, test_suite: TestSuite):
         self.add_snapshot(project_id, test_suite.to_snapshot())
 
+    def add_test_suites(self, project_id: STR_UUID, test_suites: List[TestSuite]):
+        self.add_snapshots(project_id, [test_suite.to_snapshot() for test_suite in test_suites])
+
     @abc.abstractmethod
     def add_snapshot(self, project_id: STR_UUID, snapshot: Snapshot):
         raise NotImplementedError
 
+    def add_snapshots(self, project_id: STR_UUID, snapshots: List[Snapshot]):
+        for snapshot in snapshots:
+            self.add_snapshot(project_id, snapshot)
+
     @abc.abstractmethod
     def delete_snapshot(self, project_id: STR_UUID, snapshot_id: STR_UUID):
         raise NotImplementedError
@@ -308,6 +318,13 @@ class Workspace(WorkspaceBase[Project]):
             project_id = uuid.UUID(project_id)
         self._projects[project_id].add_snapshot(snapshot)
 
+    def add_snapshots(self, project_id: STR_UUID, snapshots: List[Snapshot]):
+        if isinstance(project_id, str):
+            project_id = uuid.UUID(project_id)
+        project = self._projects[project_id]
+        for snapshot in snapshots:
+            project.add_snapshot(snapshot)
+
     def delete_snapshot(self, project_id: STR_UUID, snapshot_id: STR_UUID):
         if isinstance(project_id, str):
             project_id = uuid.UUID(project_id)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -15,42 +16,77 @@ from sklearn.pipeline import Pipeline
 from evidently.calculations.stattests import PossibleStatTestType
 
 
-def resolve_stattest_threshold(
-    feature_name: str,
+@lru_cache(maxsize=None)
+def _resolve_defaults(
     feature_type: str,
     stattest: Optional[PossibleStatTestType],
     cat_stattest: Optional[PossibleStatTestType],
     num_stattest: Optional[PossibleStatTestType],
     text_stattest: Optional[PossibleStatTestType],
-    per_column_stattest: Optional[Dict[str, PossibleStatTestType]],
     stattest_threshold: Optional[float],
     cat_stattest_threshold: Optional[float],
     num_stattest_threshold: Optional[float],
     text_stattest_threshold: Optional[float],
-    per_column_stattest_threshold: Optional[Dict[str, float]],
 ) -> Tuple[Optional[PossibleStatTestType], Optional[float]]:
+    """Resolve stattest and threshold ignoring per-column overrides.
+
+    The result only depends on the feature type and the shared settings, so it
+    is memoized: features without per-column overrides hit the cache.
+    """
     return (
         _calculate_stattest(
-            feature_name,
+            "",
             feature_type,
             stattest,
             cat_stattest,
             num_stattest,
             text_stattest,
-            per_column_stattest,
+            None,
         ),
         _calculate_threshold(
-            feature_name,
+            "",
             feature_type,
             stattest_threshold,
             cat_stattest_threshold,
             num_stattest_threshold,
             text_stattest_threshold,
-            per_column_stattest_threshold,
+            None,
         ),
     )
 
 
+def resolve_stattest_threshold(
+    feature_name: str,
+    feature_type: str,
+    stattest: Optional[PossibleStatTestType],
+    cat_stattest: Optional[PossibleStatTestType],
+    num_stattest: Optional[PossibleStatTestType],
+    text_stattest: Optional[PossibleStatTestType],
+    per_column_stattest: Optional[Dict[str, PossibleStatTestType]],
+    stattest_threshold: Optional[float],
+    cat_stattest_threshold: Optional[float],
+    num_stattest_threshold: Optional[float],
+    text_stattest_threshold: Optional[float],
+    per_column_stattest_threshold: Optional[Dict[str, float]],
+) -> Tuple[Optional[PossibleStatTestType], Optional[float]]:
+    func, threshold = _resolve_defaults(
+        feature_type,
+        stattest,
+        cat_stattest,
+        num_stattest,
+        text_stattest,
+        stattest_threshold,
+        cat_stattest_threshold,
+        num_stattest_threshold,
+        text_stattest_threshold,
+    )
+    if per_column_stattest is not None:
+        func = per_column_stattest.get(feature_name, func)
+    if per_column_stattest_threshold is not None and feature_name in per_column_stattest_threshold:
+        threshold = per_column_stattest_threshold[feature_name]
+    return func, threshold
+
+
 def _calculate_stattest(
     feature_name: str,
     feature_type: str,
@@ -4,7 +4,9 @@ import pandas as pd
 
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.test_suite import TestSuite
+from evidently.tests import TestAllFeaturesValueDrift
 from evidently.tests import TestColumnDrift
+from evidently.tests import TestCustomFeaturesValueDrift
 from evidently.tests import TestNumberOfDriftedColumns
 from evidently.tests import TestShareOfDriftedColumns
 
@@ -212,3 +214,62 @@ def test_data_drift_test_feature_value_drift_json_render() -> None:
         },
         "status": "SUCCESS",
     }
+
+
+def test_data_drift_test_all_features_value_drift_snapshot_roundtrip(tmp_path) -> None:
+    test_current_dataset = pd.DataFrame(
+        {
+            "category_feature": ["n", "d", "p", "n"],
+            "numerical_feature": [0, 1, 2, 5],
+            "target": [0, 0, 0, 1],
+            "prediction": [0, 0, 0, 1],
+        }
+    )
+    suite = TestSuite(tests=[TestAllFeaturesValueDrift(num_stattest="wasserstein")])
+    suite.run(current_data=test_current_dataset, reference_data=test_current_dataset, column_mapping=ColumnMapping())
+    suite._inner_suite.raise_for_error()
+    assert suite
+
+    path = str(tmp_path / "suite_snapshot.json")
+    suite.save(path)
+    loaded_suite = TestSuite.load(path)
+    assert loaded_suite
+    assert json.loads(loaded_suite.json())["tests"] == json.loads(suite.json())["tests"]
+    # rendering the reloaded suite resolves results from the stored table
+    assert loaded_suite.show()
+    loaded_tests = {
+        test.column_name.display_name: test for test in loaded_suite._inner_suite.context.test_results.keys()
+    }
+    assert loaded_tests["numerical_feature"].stattest == "wasserstein"
+
+
+def test_data_drift_test_all_features_value_drift_error_isolation() -> None:
+    test_current_dataset = pd.DataFrame(
+        {
+            "good_feature": [0, 1, 2, 3],
+            "bad_feature": [None, None, None, None],
+        }
+    )
+    suite = TestSuite(tests=[TestAllFeaturesValueDrift()])
+    suite.run(current_data=test_current_dataset, reference_data=test_current_dataset, column_mapping=ColumnMapping())
+    statuses = {}
+    for test_info in json.loads(suite.json())["tests"]:
+        for column in ("good_feature", "bad_feature"):
+            if column in test_info["description"]:
+                statuses[column] = test_info["status"]
+    assert statuses["good_feature"] == "SUCCESS"
+    assert statuses["bad_feature"] == "ERROR"
+
+
+def test_data_drift_test_custom_features_value_drift_for_utility_columns() -> None:
+    test_current_dataset = pd.DataFrame(
+        {
+            "numerical_feature": [0, 1, 2, 3],
+            "target": [0, 0, 0, 1],
+            "prediction": [0, 0, 0, 1],
+        }
+    )
+    suite = TestSuite(tests=[TestCustomFeaturesValueDrift(features=["target", "numerical_feature"])])
+    suite.run(current_data=test_current_dataset, reference_data=test_current_dataset, column_mapping=ColumnMapping())
+    suite._inner_suite.raise_for_error()
+    assert suite
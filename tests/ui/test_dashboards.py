@@ -0,0 +1,18 @@
+from evidently.ui.dashboards import CounterAgg
+from evidently.ui.dashboards import DashboardConfig
+from evidently.ui.dashboards import DashboardPanelCounter
+from evidently.ui.dashboards import ReportFilter
+
+
+def test_dashboard_config_add_panels():
+    config = DashboardConfig(name="dashboard", panels=[])
+    panels = [
+        DashboardPanelCounter(
+            filter=ReportFilter(metadata_values={}, tag_values=[]),
+            agg=CounterAgg.NONE,
+            title=title,
+        )
+        for title in ("first", "second")
+    ]
+    config.add_panels(panels)
+    assert [panel.title for panel in config.panels] == ["first", "second"]
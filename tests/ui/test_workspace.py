@@ -0,0 +1,42 @@
+from unittest import mock
+
+import pandas as pd
+
+from evidently.metrics import DatasetSummaryMetric
+from evidently.report import Report
+from evidently.test_suite import TestSuite
+from evidently.tests import TestNumberOfColumns
+from evidently.ui.remote import RemoteWorkspace
+from evidently.ui.workspace import Workspace
+
+
+def test_workspace_add_snapshots(tmp_path):
+    test_data = pd.DataFrame({"feature_1": [0, 1, 2, 3], "feature_2": [0, 1, 2, 3]})
+
+    report = Report(metrics=[DatasetSummaryMetric()])
+    report.run(current_data=test_data, reference_data=test_data)
+    suite = TestSuite(tests=[TestNumberOfColumns()])
+    suite.run(current_data=test_data, reference_data=test_data)
+
+    workspace = Workspace.create(str(tmp_path / "workspace"))
+    project = workspace.create_project("test project")
+    workspace.add_snapshots(project.id, [report.to_snapshot(), suite.to_snapshot()])
+
+    assert len(project.reports) == 1
+    assert len(project.test_suites) == 1
+
+
+def test_remote_workspace_add_snapshots_uses_single_session():
+    with mock.patch("evidently.ui.remote.requests") as requests_mock:
+        workspace = RemoteWorkspace("http://localhost:8000")
+        session = requests_mock.Session.return_value.__enter__.return_value
+
+        snapshots = [mock.Mock(**{"dict.return_value": {"id": str(i)}}) for i in range(3)]
+        workspace.add_snapshots("project-id", snapshots)
+
+        requests_mock.Session.assert_called_once()
+        assert session.request.call_count == len(snapshots)
+        for call in session.request.call_args_list:
+            assert call.args[0] == "POST"
+        # only the constructor's verify() goes through the sessionless path
+        requests_mock.request.assert_called_once()